@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import importlib.util
+import os
 import re
 import shutil
 import sys
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import pandas as pd
-from PySide6.QtCore import QSize, Qt, QTimer
-from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen, QPixmap
+from types import ModuleType
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -25,8 +41,7 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolTip,
     QVBoxLayout,
@@ -34,6 +49,29 @@ from PySide6.QtWidgets import (
 )
 
 
+def _lazy_import(name: str) -> ModuleType:
+    # The module body only runs on first attribute access, so the splash can paint before pandas loads.
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}")
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+else:
+    np = _lazy_import("numpy")
+    pd = _lazy_import("pandas")
+
+
 CHECK_COLUMN_CANDIDATES = [
     "check number",
     "checkno",
@@ -48,6 +86,28 @@ CHECK_COLUMN_CANDIDATES = [
 VENDOR_COLUMN_CANDIDATES = ["vendor", "payee", "name", "vendor name"]
 CHECK_TEXT_PREFIXES = ("check", "cheque", "chk")
 
+_PREFIX_RE = re.compile(r"^\s*(?:" + "|".join(CHECK_TEXT_PREFIXES) + r")\s*[-:#]*\s*(\d+)\s*$", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"(\d+)")
+_FICLONE = 0x40049409
+# Arrow-backed strings keep .str operations on contiguous buffers; pandas 2.x defaults "string" to Python objects.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_STRING_DTYPE = "string[pyarrow]" if _HAS_PYARROW else "string"
+
+# QuickBooks CSVs above this size are never loaded whole; they are matched and written in chunks.
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+STREAMING_CHUNK_ROWS = 256_000
+PREVIEW_ROWS = 100
+# Wide files get fewer preview rows so the preview stays around this many cells.
+PREVIEW_MAX_CELLS = 2000
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLUMNS = 16_384
+
+# Same tokens pandas treats as missing by default, so both CSV readers agree.
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
 TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "en": {
         "lang_english": "English",
@@ -84,7 +144,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "reset": "Reset",
         "how_matching": "How matching works",
         "summary": "Summary",
-        "preview": "Preview (first 100 rows)",
+        "preview": "Preview (first {rows} rows)",
         "summary_placeholder": "Summary will appear here after processing...",
         "status_prefix": "Status",
         "ready": "Ready",
@@ -122,6 +182,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "help_text": "Matching uses the selected check-number columns from both files.\n- Normalize: trims spaces and removes trailing '.0'.\n- Extract: reads numbers from values like 'Check 101' or 'CHK-101'.\nTurn these off for strict exact text matching.",
         "unsupported_input": "Unsupported file type. Please select CSV or Excel (.xlsx).",
         "unsupported_output": "Unsupported output format. Please save as .csv or .xlsx.",
+        "large_qb": "Large QuickBooks file: rows are processed in chunks and the result can only be saved as CSV.",
+        "stream_csv_only": "Large QuickBooks files can only be saved as CSV.",
     },
     "es": {
         "lang_english": "Inglés",
@@ -158,7 +220,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "reset": "Restablecer",
         "how_matching": "Cómo funciona la coincidencia",
         "summary": "Resumen",
-        "preview": "Vista previa (primeras 100 filas)",
+        "preview": "Vista previa (primeras {rows} filas)",
         "summary_placeholder": "El resumen aparecerá aquí después de procesar...",
         "status_prefix": "Estado",
         "ready": "Listo",
@@ -196,10 +258,42 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "help_text": "La coincidencia usa las columnas de número de cheque seleccionadas en ambos archivos.\n- Normalizar: recorta espacios y quita '.0'.\n- Extraer: toma números de valores como 'Check 101' o 'CHK-101'.\nDesactive estas opciones para coincidencia estricta por texto.",
         "unsupported_input": "Tipo de archivo no compatible. Seleccione CSV o Excel (.xlsx).",
         "unsupported_output": "Formato de salida no compatible. Guarde como .csv o .xlsx.",
+        "large_qb": "Archivo QuickBooks grande: las filas se procesan por bloques y el resultado solo puede guardarse como CSV.",
+        "stream_csv_only": "Los archivos QuickBooks grandes solo pueden guardarse como CSV.",
     },
 }
 
 
+_LOGIN_QSS = (
+    "QDialog { background: #111111; color: #f5f5f5; }"
+    "QLineEdit, QComboBox { background: #0f0f10; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 6px; padding: 6px; }"
+    "QPushButton { background: #1c1c1d; color: #fff8e6; border: 1px solid #d4af37; border-radius: 6px; min-height: 30px; font-weight: 600; }"
+    "QPushButton:hover { background: #2a2a2c; }"
+)
+
+_MAIN_QSS = """
+QMainWindow { background: #0f0f10; color: #f5f5f5; }
+QLabel { color: #f5f5f5; }
+#mainTitle { font-size: 30px; font-weight: 800; color: #f2c14e; letter-spacing: 0.5px; }
+#subTitle { color: #f3e8ca; margin-bottom: 8px; font-size: 13px; }
+#statusLabel { font-weight: 700; color: #fff8e6; background: #1f1f20; border: 1px solid #d4af37; border-radius: 8px; padding: 8px 10px; }
+QGroupBox#panel { font-weight: 700; border: 1px solid #d4af37; border-radius: 12px; margin-top: 10px; background: #151516; padding: 10px; color: #f5f5f5; }
+QGroupBox#panel::title { subcontrol-origin: margin; left: 10px; padding: 0 6px; color: #f2c14e; }
+QPushButton { min-height: 34px; padding: 6px 12px; border-radius: 8px; border: 1px solid #d4af37; background: #1c1c1d; color: #fff8e6; font-weight: 600; }
+QPushButton:hover { background: #2a2a2c; }
+QPushButton:pressed { background: #111111; }
+QPushButton:disabled { color: #8b8b8b; border: 1px solid #545454; background: #1a1a1a; }
+QLineEdit, QComboBox, QTextEdit { background: #0f0f10; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 8px; padding: 6px; selection-background-color: #d4af37; selection-color: #111111; }
+QCheckBox { color: #f5f5f5; spacing: 8px; }
+QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #c29b2d; border-radius: 4px; background: #111111; }
+QCheckBox::indicator:checked { background: #d4af37; }
+#summaryBox { background: #101011; color: #f5f5f5; }
+#previewTable { gridline-color: #3c3c3f; alternate-background-color: #171718; background: #101011; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 8px; }
+QHeaderView::section { background: #d4af37; color: #151516; padding: 6px; border: 0; border-right: 1px solid #8a6b1d; border-bottom: 1px solid #8a6b1d; font-weight: 700; }
+QToolTip { background-color: #111111; color: #f5f5f5; border: 1px solid #d4af37; padding: 6px; }
+"""
+
+
 def normalize_check_number(value: object, normalize_mode: bool = True, extract_from_text_mode: bool = True) -> str:
     if pd.isna(value):
         return ""
@@ -209,29 +303,463 @@ def normalize_check_number(value: object, normalize_mode: bool = True, extract_f
     if not normalize_mode:
         return text
 
-    cleaned = text.strip()
-    if cleaned.endswith(".0"):
-        cleaned = cleaned[:-2].strip()
+    # text is already stripped; only a removed ".0" (as in "12 .0") can expose new trailing whitespace.
+    cleaned = text[:-2].strip() if text.endswith(".0") else text
+    # Most check numbers are already plain digits, which both patterns would return unchanged.
+    if cleaned.isdecimal():
+        return cleaned
 
     if extract_from_text_mode:
-        prefix_pattern = r"^\s*(?:" + "|".join(CHECK_TEXT_PREFIXES) + r")\s*[-:#]*\s*(\d+)\s*$"
-        pref_match = re.match(prefix_pattern, cleaned, flags=re.IGNORECASE)
+        pref_match = _PREFIX_RE.match(cleaned)
         if pref_match:
             return pref_match.group(1)
-        number_match = re.search(r"(\d+)", cleaned)
+        number_match = _NUMBER_RE.search(cleaned)
         if number_match:
             return number_match.group(1)
 
     return cleaned
 
 
+def _normalize_numpy(values: pd.Series, normalize_mode: bool = True, extract_from_text_mode: bool = True) -> np.ndarray:
+    # Kept as an object array: a fixed-width "<U" array is sized by the longest cell, which explodes on memo-like columns.
+    raw = values.to_numpy(dtype=object)
+    text = np.array(["" if missing else str(value).strip() for value, missing in zip(raw, pd.isna(raw))], dtype=object)
+    if not normalize_mode:
+        return text
+
+    # Plain digit values are final; the rest go through the scalar rules once per distinct value.
+    needs_normalize = np.fromiter((not value.isdecimal() for value in text), dtype=bool, count=len(text))
+    if needs_normalize.any():
+        uniques, inverse = np.unique(text[needs_normalize], return_inverse=True)
+        normalized = np.array([normalize_check_number(v, True, extract_from_text_mode) for v in uniques.tolist()], dtype=object)
+        text[needs_normalize] = normalized[inverse]
+    return text
+
+
+def normalize_check_series(values: pd.Series, normalize_mode: bool = True, extract_from_text_mode: bool = True) -> pd.Series:
+    if not _HAS_PYARROW:
+        # Python-backed .str methods loop per element anyway, so batch through NumPy instead.
+        normalized = _normalize_numpy(values, normalize_mode, extract_from_text_mode)
+        return pd.Series(normalized, index=values.index, dtype=_STRING_DTYPE)
+
+    text = values.astype(_STRING_DTYPE).str.strip().fillna("")
+    if not normalize_mode:
+        return text
+
+    cleaned = text.str.removesuffix(".0").str.strip()
+    if extract_from_text_mode:
+        # Only values that are not already plain digits go through the regexes.
+        needs_extract = ~cleaned.str.isdecimal()
+        if needs_extract.any():
+            rest = cleaned[needs_extract]
+            extracted = rest.str.extract(_PREFIX_RE, expand=False)
+            extracted = extracted.fillna(rest.str.extract(_NUMBER_RE, expand=False))
+            cleaned = cleaned.mask(needs_extract, extracted.fillna(rest))
+
+    return cleaned
+
+
+def read_csv_with_arrow(path: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    # Arrow parses the header itself, since a quoted name can span lines, but its raw names may repeat or be blank
+    # ("a", "a", ""); they are renamed by position to the names pandas gives the same header ("a", "a.1", "Unnamed: 2").
+    columns = [str(c) for c in pd.read_csv(path, nrows=0).columns]
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    with pa_csv.open_csv(path, parse_options=parse_options) as reader:
+        raw_names = reader.schema.names
+    raw_by_column = dict(zip(columns, raw_names))
+
+    # include_columns selects by raw name, which only works when that name is unique in the header.
+    include_columns = None
+    if usecols is not None:
+        selected = [raw_by_column[c] for c in usecols]
+        if all(raw_names.count(name) == 1 for name in selected):
+            include_columns = selected
+
+    # Arrow infers numeric types by default, which would turn "00123" into 123; every column is read as text instead.
+    table = pa_csv.read_csv(
+        path,
+        parse_options=parse_options,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in raw_names},
+            include_columns=include_columns,
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    if include_columns is not None:
+        table = table.rename_columns(list(usecols))
+    else:
+        table = table.rename_columns(columns)
+        if usecols is not None:
+            table = table.select(list(usecols))
+    # Columns stay Arrow-backed strings, so the .str work downstream runs on the Arrow buffers.
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+def _arrow_text_table(df: pd.DataFrame) -> pa.Table:
+    import pyarrow as pa
+
+    # Only text columns are accepted; numbers or dates (e.g. from Excel input) raise so pandas keeps formatting them.
+    arrays = [pa.array(df.iloc[:, idx], type=pa.string(), from_pandas=True) for idx in range(df.shape[1])]
+    return pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+
+
+def write_csv_with_arrow(df: pd.DataFrame, path: str) -> None:
+    from pyarrow import csv as pa_csv
+
+    pa_csv.write_csv(_arrow_text_table(df), path)
+
+
+def write_csv_chunk(df: pd.DataFrame, output: BinaryIO, header: bool) -> None:
+    # Streamed output uses the same writer as a normal save, so the file keeps its quoting and line endings
+    # whichever side of the streaming threshold the input is on.
+    if not _HAS_PYARROW:
+        df.to_csv(output, index=False, header=header, encoding="utf-8")
+        return
+    from pyarrow import csv as pa_csv
+
+    pa_csv.write_csv(_arrow_text_table(df), output, pa_csv.WriteOptions(include_header=header))
+
+
+def write_xlsx_with_xlsxwriter(df: pd.DataFrame, path: str) -> None:
+    import xlsxwriter
+
+    # xlsxwriter skips cells past the sheet limits without raising, so oversized frames are rejected up front.
+    if len(df) + 1 > EXCEL_MAX_ROWS or df.shape[1] > EXCEL_MAX_COLUMNS:
+        raise ValueError(
+            f"This sheet is too large! Your sheet size is: {len(df) + 1}, {df.shape[1]} "
+            f"Max sheet size is: {EXCEL_MAX_ROWS}, {EXCEL_MAX_COLUMNS}"
+        )
+
+    # constant_memory flushes each row as soon as the next one starts, so cells must be written row by row;
+    # DataFrame.to_excel emits them column by column and would silently lose data in this mode.
+    # URL-like text stays plain text, as with to_excel; hyperlinks have per-sheet and length limits that blank cells.
+    workbook = xlsxwriter.Workbook(
+        path,
+        {"constant_memory": True, "strings_to_urls": False, "default_date_format": "yyyy-mm-dd hh:mm:ss"},
+    )
+    try:
+        worksheet = workbook.add_worksheet("Sheet1")
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        _write_xlsx_row(worksheet, 0, [str(c) for c in df.columns], path, header_format)
+        values = df.astype(object).where(df.notna(), None)
+        for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            _write_xlsx_row(worksheet, row_idx, row, path)
+    finally:
+        workbook.close()
+
+
+def _write_xlsx_row(worksheet, row_idx: int, row: Tuple[object, ...], path: str, cell_format=None) -> None:
+    # -2 means a string was truncated to Excel's cell limit; write_row stops there, so the row is rewritten cell by cell.
+    # Any other error code means a cell was not written at all.
+    error = worksheet.write_row(row_idx, 0, row, cell_format)
+    if error == -2:
+        for col_idx, value in enumerate(row):
+            cell_error = worksheet.write(row_idx, col_idx, value, cell_format)
+            if cell_error not in (0, -2):
+                error = cell_error
+                break
+        else:
+            return
+    if error:
+        raise ValueError(f"Could not write row {row_idx + 1} to {path} (xlsxwriter error {error})")
+
+
+def build_vendor_lookup(check_keys: pd.Series, vendors: pd.Series) -> Tuple[Dict[str, str], Dict[str, int]]:
+    lookup: Dict[str, str] = {}
+    duplicates: Dict[str, int] = {}
+    for key, vendor in zip(check_keys, vendors):
+        if not key:
+            continue
+        if key in lookup:
+            duplicates[key] = duplicates.get(key, 1) + 1
+        else:
+            lookup[key] = vendor
+    return lookup, duplicates
+
+
+def _clean_vendor_names(values: pd.Series) -> pd.Series:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        # All-text columns are trimmed in one pass over the UTF-8 buffer; anything else takes the category path.
+        trimmed = pc.utf8_trim_whitespace(pa.array(values, type=pa.string(), from_pandas=True))
+        return pd.Series(pc.fill_null(trimmed, "").to_numpy(zero_copy_only=False), index=values.index, dtype=object)
+    except (ImportError, TypeError, ValueError):
+        # Vendor names repeat heavily, so each distinct name is cleaned once and shared through category codes.
+        return values.fillna("").astype("category").map(lambda v: str(v).strip())
+
+
+@dataclass
+class VendorUpdateResult:
+    updated_df: pd.DataFrame
+    unmatched_df: pd.DataFrame
+    duplicates: Dict[str, int]
+    total_rows: int
+    matched_rows: int
+    replaced_rows: int
+    skipped_rows: int
+
+
+def build_reference_lookup(
+    reference_df: pd.DataFrame,
+    ref_check: str,
+    ref_vendor: str,
+    normalize_mode: bool = True,
+    extract_from_text_mode: bool = True,
+) -> Tuple[Dict[str, str], Dict[str, int]]:
+    check_keys = normalize_check_series(reference_df[ref_check], normalize_mode, extract_from_text_mode)
+    # Rows without a usable check number never reach the lookup, so their vendor names are not cleaned.
+    has_key = (check_keys != "").to_numpy(dtype=bool)
+    return build_vendor_lookup(check_keys[has_key], _clean_vendor_names(reference_df[ref_vendor][has_key]))
+
+
+def stream_reference_lookup(
+    reference_path: str,
+    ref_check: str,
+    ref_vendor: str,
+    normalize_mode: bool = True,
+    extract_from_text_mode: bool = True,
+) -> Tuple[Dict[str, str], Dict[str, int]]:
+    # Only the normalized keys and cleaned vendor names of each chunk are kept, never the full reference frame.
+    check_keys: List[np.ndarray] = []
+    vendors: List[np.ndarray] = []
+    usecols = list(dict.fromkeys([ref_check, ref_vendor]))
+    with pd.read_csv(reference_path, dtype=object, usecols=usecols, chunksize=STREAMING_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            chunk_keys = normalize_check_series(chunk[ref_check], normalize_mode, extract_from_text_mode)
+            has_key = (chunk_keys != "").to_numpy(dtype=bool)
+            check_keys.append(chunk_keys[has_key].to_numpy(dtype=object))
+            vendors.append(_clean_vendor_names(chunk[ref_vendor][has_key]).to_numpy(dtype=object))
+    if not check_keys:
+        return {}, {}
+    return build_vendor_lookup(np.concatenate(check_keys), np.concatenate(vendors))
+
+
+def apply_vendor_lookup(
+    quickbooks_df: pd.DataFrame,
+    lookup: Dict[str, str],
+    duplicates: Dict[str, int],
+    qb_check: str,
+    qb_vendor: str,
+    normalize_mode: bool = True,
+    extract_from_text_mode: bool = True,
+) -> VendorUpdateResult:
+    check_keys = normalize_check_series(quickbooks_df[qb_check], normalize_mode, extract_from_text_mode)
+    if not lookup:
+        # Nothing can match an empty reference; the keys are only needed for the skipped-row count.
+        return VendorUpdateResult(
+            updated_df=quickbooks_df.copy(deep=False),
+            unmatched_df=quickbooks_df.loc[:, [qb_check, qb_vendor]],
+            duplicates=duplicates,
+            total_rows=len(quickbooks_df),
+            matched_rows=0,
+            replaced_rows=0,
+            skipped_rows=int((check_keys == "").sum()),
+        )
+
+    # Check numbers repeat across split lines and payments; map each distinct key once through the categories.
+    matched_vendors = check_keys.astype("category").map(lookup).astype(object)
+    match_mask = matched_vendors.notna().to_numpy()
+
+    # Only matched rows can be replaced, so only their previous vendor text is built for the comparison.
+    existing_vendors = quickbooks_df[qb_vendor].to_numpy(dtype=object)[match_mask]
+    existing_vendors = pd.Series(existing_vendors, dtype=object).fillna("").astype(str).to_numpy(dtype=object)
+    replaced_rows = int(np.count_nonzero(existing_vendors != matched_vendors.to_numpy(dtype=object)[match_mask]))
+
+    # Shallow copy: only the vendor column is replaced, every other column is shared with the input.
+    updated_df = quickbooks_df.copy(deep=False)
+    updated_df[qb_vendor] = np.where(match_mask, matched_vendors.to_numpy(dtype=object), quickbooks_df[qb_vendor].to_numpy(dtype=object))
+
+    return VendorUpdateResult(
+        updated_df=updated_df,
+        unmatched_df=updated_df.loc[~match_mask, [qb_check, qb_vendor]],
+        duplicates=duplicates,
+        total_rows=len(updated_df),
+        matched_rows=int(np.count_nonzero(match_mask)),
+        replaced_rows=replaced_rows,
+        skipped_rows=int((check_keys == "").sum()),
+    )
+
+
+def update_vendor_names(
+    quickbooks_df: pd.DataFrame,
+    reference_df: pd.DataFrame,
+    qb_check: str,
+    qb_vendor: str,
+    ref_check: str,
+    ref_vendor: str,
+    normalize_mode: bool = True,
+    extract_from_text_mode: bool = True,
+) -> VendorUpdateResult:
+    lookup, duplicates = build_reference_lookup(reference_df, ref_check, ref_vendor, normalize_mode, extract_from_text_mode)
+    return apply_vendor_lookup(quickbooks_df, lookup, duplicates, qb_check, qb_vendor, normalize_mode, extract_from_text_mode)
+
+
+def stream_vendor_updates(
+    quickbooks_path: str,
+    lookup: Dict[str, str],
+    duplicates: Dict[str, int],
+    qb_check: str,
+    qb_vendor: str,
+    normalize_mode: bool = True,
+    extract_from_text_mode: bool = True,
+    output_path: Optional[str] = None,
+) -> VendorUpdateResult:
+    # Same matching as apply_vendor_lookup, but the QuickBooks CSV is read and written one chunk at a time.
+    # Only the preview rows and the two-column unmatched report are kept in memory.
+    preview: Optional[pd.DataFrame] = None
+    unmatched: List[pd.DataFrame] = []
+    total_rows = matched_rows = replaced_rows = skipped_rows = 0
+
+    # Rows are written to a temp file next to the target and moved over it at the end,
+    # so saving over the QuickBooks file itself does not truncate it while it is still being read.
+    temp_path = Path(output_path).with_name(Path(output_path).name + ".tmp") if output_path else None
+    try:
+        with open(temp_path, "wb") if temp_path else nullcontext() as output:
+            with pd.read_csv(quickbooks_path, dtype=object, chunksize=STREAMING_CHUNK_ROWS) as reader:
+                for chunk in reader:
+                    result = apply_vendor_lookup(chunk, lookup, duplicates, qb_check, qb_vendor, normalize_mode, extract_from_text_mode)
+                    if output is not None:
+                        write_csv_chunk(result.updated_df, output, header=preview is None)
+                    if preview is None:
+                        preview = result.updated_df.head(PREVIEW_ROWS)
+                    unmatched.append(result.unmatched_df)
+                    total_rows += result.total_rows
+                    matched_rows += result.matched_rows
+                    replaced_rows += result.replaced_rows
+                    skipped_rows += result.skipped_rows
+
+            if preview is None:
+                preview = pd.read_csv(quickbooks_path, dtype=object, nrows=0)
+                if output is not None:
+                    write_csv_chunk(preview, output, header=True)
+        if temp_path is not None:
+            os.replace(temp_path, output_path)
+    finally:
+        if temp_path is not None and temp_path.exists():
+            temp_path.unlink()
+
+    return VendorUpdateResult(
+        updated_df=preview,
+        unmatched_df=pd.concat(unmatched, ignore_index=True) if unmatched else preview.loc[:, [qb_check, qb_vendor]],
+        duplicates=duplicates,
+        total_rows=total_rows,
+        matched_rows=matched_rows,
+        replaced_rows=replaced_rows,
+        skipped_rows=skipped_rows,
+    )
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    # Let the OS copy inside the kernel: CopyFileExW on Windows, a copy-on-write clone (Btrfs, XFS) elsewhere.
+    # shutil.copyfile already uses sendfile/fcopyfile on Linux and macOS when cloning is not supported.
+    copied = False
+    if sys.platform == "win32":
+        import ctypes
+
+        copied = bool(ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0))
+    else:
+        try:
+            import fcntl
+
+            with open(src, "rb") as source, open(dst, "wb") as target:
+                fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+            copied = True
+        except (ImportError, OSError):
+            pass
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+class DataFrameModel(QAbstractTableModel):
+    def __init__(self, df: pd.DataFrame, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._load(df)
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        self.beginResetModel()
+        self._load(df)
+        self.endResetModel()
+
+    def _load(self, df: pd.DataFrame) -> None:
+        # Missing values are blanked once up front so data() is a plain array lookup.
+        self._values = df.astype(object).where(df.notna(), "").to_numpy()
+        self._columns = [str(c) for c in df.columns]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else self._values.shape[0]
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:  # type: ignore[override]
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return str(self._values[index.row(), index.column()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> object:  # type: ignore[override]
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class BackgroundTask(QRunnable):
+    def __init__(self, func: Callable[[], object]) -> None:
+        super().__init__()
+        self.func = func
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func()
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+            return
+        self.signals.finished.emit(result)
+
+
+def _load_table(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if Path(path).suffix.lower() == ".csv":
+        try:
+            return read_csv_with_arrow(path, columns)
+        except (ImportError, ValueError):
+            return pd.read_csv(path, dtype=object, usecols=columns)
+    try:
+        return pd.read_excel(path, dtype=object, usecols=columns, engine="calamine")
+    except ImportError:
+        return pd.read_excel(path, dtype=object, usecols=columns)
+
+
+# mtime_ns and size are only part of the cache key, so an edited file is re-read.
+# Only the last full QuickBooks frame is kept; reference reads are cached as lookups instead.
+@lru_cache(maxsize=1)
+def _read_table_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    return _load_table(path)
+
+
 class SplashScreen(QWidget):
+    _BACKGROUND_CACHE_KEY = "splash_bg_v1"
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setFixedSize(QSize(900, 500))
-        self._background = self._build_background()
+        # Built on first paint so loading and scaling the image stays out of construction.
+        self._background: Optional[QPixmap] = None
 
     def _build_background(self) -> QPixmap:
         splash_path = Path(__file__).parent / "assets" / "splash_bg.jpg"
@@ -259,6 +787,13 @@ class SplashScreen(QWidget):
         return canvas
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        if self._background is None:
+            background = QPixmap()
+            if not QPixmapCache.find(self._BACKGROUND_CACHE_KEY, background):
+                background = self._build_background()
+                QPixmapCache.insert(self._BACKGROUND_CACHE_KEY, background)
+            self._background = background
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.drawPixmap(self.rect(), self._background)
@@ -273,7 +808,7 @@ class SplashScreen(QWidget):
 class LoginDialog(QDialog):
     def __init__(self, language: str = "en") -> None:
         super().__init__()
-        self.language = language if language in TRANSLATIONS else "en"
+        self._set_language(language)
         self.setModal(True)
         self.setFixedSize(390, 260)
 
@@ -310,20 +845,19 @@ class LoginDialog(QDialog):
         layout.addWidget(self.message_label)
         layout.addWidget(self.login_btn)
 
-        self.setStyleSheet(
-            "QDialog { background: #111111; color: #f5f5f5; }"
-            "QLineEdit, QComboBox { background: #0f0f10; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 6px; padding: 6px; }"
-            "QPushButton { background: #1c1c1d; color: #fff8e6; border: 1px solid #d4af37; border-radius: 6px; min-height: 30px; font-weight: 600; }"
-            "QPushButton:hover { background: #2a2a2c; }"
-        )
+        self.setStyleSheet(_LOGIN_QSS)
         self._apply_texts()
 
     def tr(self, key: str, **kwargs: object) -> str:
-        text = TRANSLATIONS[self.language][key]
-        return text.format(**kwargs) if kwargs else text
+        text = self._strings[key]
+        return text.format_map(kwargs) if kwargs else text
+
+    def _set_language(self, language: str) -> None:
+        self.language = language if language in TRANSLATIONS else "en"
+        self._strings = TRANSLATIONS[self.language]
 
     def _on_language_changed(self) -> None:
-        self.language = str(self.language_combo.currentData())
+        self._set_language(str(self.language_combo.currentData()))
         self._apply_texts()
 
     def _apply_texts(self) -> None:
@@ -344,22 +878,31 @@ class LoginDialog(QDialog):
 class CheckVendorUpdater(QMainWindow):
     def __init__(self, language: str = "en") -> None:
         super().__init__()
-        self.language = language if language in TRANSLATIONS else "en"
+        self._set_language(language)
         self.resize(1240, 800)
 
         self.quickbooks_df: Optional[pd.DataFrame] = None
-        self.reference_df: Optional[pd.DataFrame] = None
+        self.reference_columns: Optional[List[str]] = None
         self.updated_df: Optional[pd.DataFrame] = None
         self.unmatched_df: Optional[pd.DataFrame] = None
         self.duplicates: Dict[str, int] = {}
+        self.quickbooks_streaming = False
+        self.preview_rows = PREVIEW_ROWS
+        self._stream_writer: Optional[Callable[[str], VendorUpdateResult]] = None
+        self._ref_cache: Dict[Tuple[object, ...], Tuple[Dict[str, str], Dict[str, int]]] = {}
+        self._tasks: Set[BackgroundTask] = set()
 
         self._build_ui()
         self._apply_styles()
         self._apply_texts()
 
     def tr(self, key: str, **kwargs: object) -> str:
-        text = TRANSLATIONS[self.language][key]
-        return text.format(**kwargs) if kwargs else text
+        text = self._strings[key]
+        return text.format_map(kwargs) if kwargs else text
+
+    def _set_language(self, language: str) -> None:
+        self.language = language if language in TRANSLATIONS else "en"
+        self._strings = TRANSLATIONS[self.language]
 
     def _build_ui(self) -> None:
         container = QWidget(self)
@@ -480,12 +1023,10 @@ class CheckVendorUpdater(QMainWindow):
         self.summary_box.setFixedHeight(130)
 
         self.preview_title_label = QLabel()
-        self.preview_table = QTableWidget()
+        self.preview_table = QTableView()
         self.preview_table.setObjectName("previewTable")
-        self.preview_table.setColumnCount(0)
-        self.preview_table.setRowCount(0)
         self.preview_table.setAlternatingRowColors(True)
-        self.preview_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.preview_table.setEditTriggers(QTableView.NoEditTriggers)
         self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 
         root_layout.addWidget(self.file_group)
@@ -533,48 +1074,57 @@ class CheckVendorUpdater(QMainWindow):
         self.help_btn.setText(self.tr("how_matching"))
         self.reset_btn.setText(self.tr("reset"))
         self.summary_title_label.setText(self.tr("summary"))
-        self.preview_title_label.setText(self.tr("preview"))
+        self.preview_title_label.setText(self.tr("preview", rows=self.preview_rows))
         self.summary_box.setPlaceholderText(self.tr("summary_placeholder"))
         self._set_status(self.tr("ready"))
 
     def _on_language_changed(self) -> None:
-        self.language = str(self.language_combo.currentData())
+        self._set_language(str(self.language_combo.currentData()))
         self._apply_texts()
 
     def _apply_styles(self) -> None:
-        self.setStyleSheet(
-            """
-            QMainWindow { background: #0f0f10; color: #f5f5f5; }
-            QLabel { color: #f5f5f5; }
-            #mainTitle { font-size: 30px; font-weight: 800; color: #f2c14e; letter-spacing: 0.5px; }
-            #subTitle { color: #f3e8ca; margin-bottom: 8px; font-size: 13px; }
-            #statusLabel { font-weight: 700; color: #fff8e6; background: #1f1f20; border: 1px solid #d4af37; border-radius: 8px; padding: 8px 10px; }
-            QGroupBox#panel { font-weight: 700; border: 1px solid #d4af37; border-radius: 12px; margin-top: 10px; background: #151516; padding: 10px; color: #f5f5f5; }
-            QGroupBox#panel::title { subcontrol-origin: margin; left: 10px; padding: 0 6px; color: #f2c14e; }
-            QPushButton { min-height: 34px; padding: 6px 12px; border-radius: 8px; border: 1px solid #d4af37; background: #1c1c1d; color: #fff8e6; font-weight: 600; }
-            QPushButton:hover { background: #2a2a2c; }
-            QPushButton:pressed { background: #111111; }
-            QPushButton:disabled { color: #8b8b8b; border: 1px solid #545454; background: #1a1a1a; }
-            QLineEdit, QComboBox, QTextEdit { background: #0f0f10; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 8px; padding: 6px; selection-background-color: #d4af37; selection-color: #111111; }
-            QCheckBox { color: #f5f5f5; spacing: 8px; }
-            QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #c29b2d; border-radius: 4px; background: #111111; }
-            QCheckBox::indicator:checked { background: #d4af37; }
-            #summaryBox { background: #101011; color: #f5f5f5; }
-            #previewTable { gridline-color: #3c3c3f; alternate-background-color: #171718; background: #101011; color: #f5f5f5; border: 1px solid #c29b2d; border-radius: 8px; }
-            QHeaderView::section { background: #d4af37; color: #151516; padding: 6px; border: 0; border-right: 1px solid #8a6b1d; border-bottom: 1px solid #8a6b1d; font-weight: 700; }
-            QToolTip { background-color: #111111; color: #f5f5f5; border: 1px solid #d4af37; padding: 6px; }
-            """
-        )
+        self.setStyleSheet(_MAIN_QSS)
 
     def _set_status(self, text: str) -> None:
         self.status_label.setText(f"{self.tr('status_prefix')}: {text}")
 
+    def _set_busy(self, busy: bool) -> None:
+        for button in (self.qb_btn, self.ref_btn, self.process_btn, self.reset_btn):
+            button.setEnabled(not busy)
+        self.save_btn.setEnabled(not busy and self.updated_df is not None)
+
+    def _run_in_background(self, func: Callable[[], object], on_finished: Callable, on_error: Callable[[str], None]) -> None:
+        task = BackgroundTask(func)
+
+        def finish(handler: Callable, value: object) -> None:
+            self._tasks.discard(task)
+            self._set_busy(bool(self._tasks))
+            # The handlers run on the GUI thread; anything they raise is reported like a worker error
+            # instead of escaping into the Qt event loop.
+            try:
+                handler(value)
+            except Exception as exc:
+                if handler is on_error:
+                    self._error(str(exc))
+                else:
+                    on_error(str(exc))
+
+        task.signals.finished.connect(lambda result: finish(on_finished, result))
+        task.signals.error.connect(lambda message: finish(on_error, message))
+        self._tasks.add(task)
+        self._set_busy(True)
+        QThreadPool.globalInstance().start(task)
+
     def reset_app(self) -> None:
         self.quickbooks_df = None
-        self.reference_df = None
+        self.reference_columns = None
         self.updated_df = None
         self.unmatched_df = None
         self.duplicates = {}
+        self.quickbooks_streaming = False
+        self._stream_writer = None
+        self._ref_cache.clear()
+        _read_table_cached.cache_clear()
 
         self.quickbooks_path.clear()
         self.reference_path.clear()
@@ -582,30 +1132,50 @@ class CheckVendorUpdater(QMainWindow):
         self.qb_vendor_combo.clear()
         self.ref_check_combo.clear()
         self.ref_vendor_combo.clear()
-        self.preview_table.clear()
-        self.preview_table.setRowCount(0)
-        self.preview_table.setColumnCount(0)
+        self._set_preview_model(None)
+        self.preview_rows = PREVIEW_ROWS
+        self.preview_title_label.setText(self.tr("preview", rows=self.preview_rows))
         self.summary_box.clear()
         self.save_btn.setEnabled(False)
         self._set_status(self.tr("ready"))
 
     @staticmethod
-    def _read_table(path: str, language: str) -> pd.DataFrame:
+    def _read_table(path: str, language: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        if Path(path).suffix.lower() not in {".csv", ".xlsx"}:
+            raise ValueError(TRANSLATIONS[language]["unsupported_input"])
+        if usecols:
+            return _load_table(path, usecols)
+        stat = os.stat(path)
+        table = _read_table_cached(path, stat.st_mtime_ns, stat.st_size)
+        # Shallow copy so callers never modify the cached frame itself.
+        return table.copy(deep=False)
+
+    @staticmethod
+    def _read_header(path: str, language: str) -> List[str]:
         suffix = Path(path).suffix.lower()
         if suffix == ".csv":
-            return pd.read_csv(path, dtype=object)
+            return [str(c) for c in pd.read_csv(path, nrows=0).columns]
         if suffix == ".xlsx":
-            return pd.read_excel(path, dtype=object)
+            try:
+                return [str(c) for c in pd.read_excel(path, nrows=0, engine="calamine").columns]
+            except ImportError:
+                return [str(c) for c in pd.read_excel(path, nrows=0).columns]
         raise ValueError(TRANSLATIONS[language]["unsupported_input"])
 
     @staticmethod
     def _write_table(df: pd.DataFrame, path: str, language: str) -> None:
         suffix = Path(path).suffix.lower()
         if suffix == ".csv":
-            df.to_csv(path, index=False)
+            try:
+                write_csv_with_arrow(df, path)
+            except (ImportError, TypeError, ValueError):
+                df.to_csv(path, index=False)
             return
         if suffix == ".xlsx":
-            df.to_excel(path, index=False)
+            try:
+                write_xlsx_with_xlsxwriter(df, path)
+            except ImportError:
+                df.to_excel(path, index=False)
             return
         raise ValueError(TRANSLATIONS[language]["unsupported_output"])
 
@@ -613,15 +1183,35 @@ class CheckVendorUpdater(QMainWindow):
         path, _ = QFileDialog.getOpenFileName(self, self.tr("select_qb"), "", "Data Files (*.csv *.xlsx);;CSV Files (*.csv);;Excel Files (*.xlsx)")
         if not path:
             return
-        try:
-            self.quickbooks_df = self._read_table(path, self.language)
-            self.quickbooks_path.setText(path)
-            self._populate_combo(self.qb_check_combo, list(self.quickbooks_df.columns), CHECK_COLUMN_CANDIDATES)
-            self._populate_combo(self.qb_vendor_combo, list(self.quickbooks_df.columns), VENDOR_COLUMN_CANDIDATES)
-            self._update_summary(self.tr("loaded_qb"))
-            self._set_status(self.tr("qb_loaded_status"))
-        except Exception as exc:
-            self._error(self.tr("read_qb_err", error=exc))
+        language = self.language
+
+        def read_quickbooks() -> Tuple[pd.DataFrame, bool]:
+            if Path(path).suffix.lower() == ".csv" and os.path.getsize(path) > STREAMING_THRESHOLD_BYTES:
+                # Too large to hold in memory; keep a sample for column mapping and stream the rest later.
+                return pd.read_csv(path, dtype=object, nrows=PREVIEW_ROWS), True
+            return self._read_table(path, language), False
+
+        self._set_status(self.tr("processing"))
+        self._run_in_background(
+            read_quickbooks,
+            lambda loaded: self._on_quickbooks_loaded(path, *loaded),
+            lambda message: self._error(self.tr("read_qb_err", error=message)),
+        )
+
+    def _on_quickbooks_loaded(self, path: str, df: pd.DataFrame, streaming: bool) -> None:
+        self.quickbooks_df = df
+        self.quickbooks_streaming = streaming
+        # Results of an earlier run belong to the previous file and must not be saved for this one.
+        self.updated_df = None
+        self.unmatched_df = None
+        self._stream_writer = None
+        self.save_btn.setEnabled(False)
+        self.quickbooks_path.setText(path)
+        self._populate_combos(self.qb_check_combo, self.qb_vendor_combo, list(self.quickbooks_df.columns))
+        self._update_summary(self.tr("loaded_qb"))
+        if streaming:
+            self._update_summary(self.tr("large_qb"))
+        self._set_status(self.tr("qb_loaded_status"))
 
     def load_reference_csv(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -632,28 +1222,51 @@ class CheckVendorUpdater(QMainWindow):
         )
         if not path:
             return
-        try:
-            self.reference_df = self._read_table(path, self.language)
-            self.reference_path.setText(path)
-            self._populate_combo(self.ref_check_combo, list(self.reference_df.columns), CHECK_COLUMN_CANDIDATES)
-            self._populate_combo(self.ref_vendor_combo, list(self.reference_df.columns), VENDOR_COLUMN_CANDIDATES)
-            self._update_summary(self.tr("loaded_ref"))
-            self._set_status(self.tr("ref_loaded_status"))
-        except Exception as exc:
-            self._error(self.tr("read_ref_err", error=exc))
+        language = self.language
+        self._set_status(self.tr("processing"))
+        self._run_in_background(
+            lambda: self._read_header(path, language),
+            lambda columns: self._on_reference_loaded(path, columns),
+            lambda message: self._error(self.tr("read_ref_err", error=message)),
+        )
 
-    def _populate_combo(self, combo: QComboBox, columns: List[str], candidates: List[str]) -> None:
-        combo.clear()
-        combo.addItems(columns)
+    def _on_reference_loaded(self, path: str, columns: List[str]) -> None:
+        # Only the header is read here; the two mapped columns are loaded when processing.
+        self.reference_columns = columns
+        self._ref_cache.clear()
+        self.reference_path.setText(path)
+        self._populate_combos(self.ref_check_combo, self.ref_vendor_combo, columns)
+        self._update_summary(self.tr("loaded_ref"))
+        self._set_status(self.tr("ref_loaded_status"))
+
+    def _populate_combos(self, check_combo: QComboBox, vendor_combo: QComboBox, columns: List[str]) -> None:
+        # Both combos of a file search the same headers, so they are lowercased once.
         lower = {c.lower().strip(): c for c in columns}
+        self._populate_combo(check_combo, columns, CHECK_COLUMN_CANDIDATES, lower)
+        self._populate_combo(vendor_combo, columns, VENDOR_COLUMN_CANDIDATES, lower)
+
+    def _populate_combo(self, combo: QComboBox, columns: List[str], candidates: List[str], lower: Dict[str, str]) -> None:
+        # Clearing, filling and selecting would each emit change signals; only the final selection matters.
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems(columns)
+            column = self._detect_column(candidates, lower)
+            if column is not None:
+                combo.setCurrentText(column)
+
+    @staticmethod
+    def _detect_column(candidates: List[str], lower: Dict[str, str]) -> Optional[str]:
+        # Candidates are tried in priority order; an exact header is a dict hit, otherwise the first header containing it.
         for candidate in candidates:
-            for key, original in lower.items():
-                if candidate in key:
-                    combo.setCurrentText(original)
-                    return
+            if candidate in lower:
+                return lower[candidate]
+            original = next((original for key, original in lower.items() if candidate in key), None)
+            if original is not None:
+                return original
+        return None
 
     def _required_mapping(self) -> Tuple[str, str, str, str]:
-        if self.quickbooks_df is None or self.reference_df is None:
+        if self.quickbooks_df is None or self.reference_columns is None:
             raise ValueError(self.tr("missing_files"))
 
         qb_check = self.qb_check_combo.currentText().strip()
@@ -667,60 +1280,76 @@ class CheckVendorUpdater(QMainWindow):
 
     def process_updates(self) -> None:
         try:
-            self._set_status(self.tr("processing"))
             qb_check, qb_vendor, ref_check, ref_vendor = self._required_mapping()
-
-            normalize_mode = self.normalize_checkbox.isChecked()
-            extract_from_text_mode = self.extract_checkbox.isChecked()
-            qb_df = self.quickbooks_df.copy() if self.quickbooks_df is not None else None
-            ref_df = self.reference_df.copy() if self.reference_df is not None else None
-            if qb_df is None or ref_df is None:
+            ref_path = self.reference_path.text().strip()
+            if self.quickbooks_df is None or not ref_path:
                 raise ValueError(self.tr("missing_files_runtime"))
-
-            ref_df["_check_key"] = ref_df[ref_check].apply(lambda v: normalize_check_number(v, normalize_mode, extract_from_text_mode))
-            ref_df["_vendor_value"] = ref_df[ref_vendor].fillna("").astype(str).str.strip()
-
-            duplicate_counts = ref_df[ref_df["_check_key"] != ""]["_check_key"].value_counts()
-            self.duplicates = {k: int(v) for k, v in duplicate_counts[duplicate_counts > 1].to_dict().items()}
-
-            lookup_series = ref_df[ref_df["_check_key"] != ""].drop_duplicates(subset=["_check_key"], keep="first").set_index("_check_key")["_vendor_value"]
-
-            qb_df["_check_key"] = qb_df[qb_check].apply(lambda v: normalize_check_number(v, normalize_mode, extract_from_text_mode))
-            qb_df["_existing_vendor"] = qb_df[qb_vendor].fillna("").astype(str)
-            qb_df["_matched_vendor"] = qb_df["_check_key"].map(lookup_series)
-            qb_df["_is_match"] = qb_df["_matched_vendor"].notna()
-            qb_df.loc[qb_df["_is_match"], qb_vendor] = qb_df.loc[qb_df["_is_match"], "_matched_vendor"]
-
-            total_rows = len(qb_df)
-            matched_rows = int(qb_df["_is_match"].sum())
-            unmatched_rows = total_rows - matched_rows
-            replaced_rows = int((qb_df["_is_match"] & (qb_df["_existing_vendor"] != qb_df[qb_vendor].astype(str))).sum())
-            empty_check_values = int((qb_df["_check_key"] == "").sum())
-
-            self.unmatched_df = qb_df.loc[~qb_df["_is_match"], [qb_check, qb_vendor]].copy()
-            self.updated_df = qb_df.drop(columns=["_check_key", "_existing_vendor", "_matched_vendor", "_is_match"])
-            self.save_btn.setEnabled(True)
-            self._render_preview(self.updated_df)
-
-            msg_lines = [
-                self.tr("summary_done"),
-                self.tr("summary_total", value=total_rows),
-                self.tr("summary_matched", value=matched_rows),
-                self.tr("summary_unmatched", value=unmatched_rows),
-                self.tr("summary_replaced", value=replaced_rows),
-                self.tr("summary_skipped", value=empty_check_values),
-            ]
-            if self.duplicates:
-                msg_lines.append(self.tr("summary_duplicate_warn", value=len(self.duplicates)))
-
-            self.summary_box.setPlainText("\n".join(msg_lines))
-            self._set_status(self.tr("update_complete"))
-
-            if self.duplicates:
-                QMessageBox.warning(self, self.tr("duplicate_title"), self.tr("duplicate_msg"))
-
         except Exception as exc:
             self._error(str(exc))
+            return
+
+        qb_df = self.quickbooks_df
+        qb_path = self.quickbooks_path.text().strip()
+        streaming = self.quickbooks_streaming
+        normalize_mode = self.normalize_checkbox.isChecked()
+        extract_from_text_mode = self.extract_checkbox.isChecked()
+        language = self.language
+        ref_cache = self._ref_cache
+
+        def reference_lookup() -> Tuple[Dict[str, str], Dict[str, int]]:
+            # Re-running with the same reference file, columns and options reuses the normalized lookup.
+            try:
+                stat = os.stat(ref_path)
+                key = (ref_path, stat.st_mtime_ns, stat.st_size, ref_check, ref_vendor, normalize_mode, extract_from_text_mode)
+                if key not in ref_cache:
+                    if Path(ref_path).suffix.lower() == ".csv" and stat.st_size > STREAMING_THRESHOLD_BYTES:
+                        ref_cache[key] = stream_reference_lookup(ref_path, ref_check, ref_vendor, normalize_mode, extract_from_text_mode)
+                    else:
+                        ref_df = self._read_table(ref_path, language, usecols=list(dict.fromkeys([ref_check, ref_vendor])))
+                        ref_cache[key] = build_reference_lookup(ref_df, ref_check, ref_vendor, normalize_mode, extract_from_text_mode)
+                return ref_cache[key]
+            except Exception as exc:
+                raise ValueError(TRANSLATIONS[language]["read_ref_err"].format(error=exc)) from exc
+
+        def stream(output_path: Optional[str] = None) -> VendorUpdateResult:
+            lookup, duplicates = reference_lookup()
+            return stream_vendor_updates(qb_path, lookup, duplicates, qb_check, qb_vendor, normalize_mode, extract_from_text_mode, output_path)
+
+        def process() -> VendorUpdateResult:
+            if streaming:
+                return stream()
+            lookup, duplicates = reference_lookup()
+            return apply_vendor_lookup(qb_df, lookup, duplicates, qb_check, qb_vendor, normalize_mode, extract_from_text_mode)
+
+        stream_writer = stream if streaming else None
+
+        self._set_status(self.tr("processing"))
+        self._run_in_background(process, lambda result: self._on_updates_ready(result, stream_writer), self._error)
+
+    def _on_updates_ready(self, result: VendorUpdateResult, stream_writer: Optional[Callable[[str], VendorUpdateResult]] = None) -> None:
+        self.duplicates = result.duplicates
+        self.unmatched_df = result.unmatched_df
+        self.updated_df = result.updated_df
+        self._stream_writer = stream_writer
+        self.save_btn.setEnabled(True)
+        self._render_preview(self.updated_df)
+
+        msg_lines = [
+            self.tr("summary_done"),
+            self.tr("summary_total", value=result.total_rows),
+            self.tr("summary_matched", value=result.matched_rows),
+            self.tr("summary_unmatched", value=result.total_rows - result.matched_rows),
+            self.tr("summary_replaced", value=result.replaced_rows),
+            self.tr("summary_skipped", value=result.skipped_rows),
+        ]
+        if self.duplicates:
+            msg_lines.append(self.tr("summary_duplicate_warn", value=len(self.duplicates)))
+
+        self.summary_box.setPlainText("\n".join(msg_lines))
+        self._set_status(self.tr("update_complete"))
+
+        if self.duplicates:
+            QMessageBox.warning(self, self.tr("duplicate_title"), self.tr("duplicate_msg"))
 
     def save_updated_csv(self) -> None:
         if self.updated_df is None:
@@ -733,49 +1362,74 @@ class CheckVendorUpdater(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, self.tr("save_dialog"), default_name, "CSV Files (*.csv);;Excel Files (*.xlsx)")
         if not path:
             return
+        stream_writer = self._stream_writer
+        if stream_writer is not None and Path(path).suffix.lower() != ".csv":
+            self._error(self.tr("stream_csv_only"))
+            return
 
-        try:
+        updated_df = self.updated_df
+        unmatched_df = self.unmatched_df if self.unmatched_checkbox.isChecked() else None
+        backup_source = qb_text if self.backup_checkbox.isChecked() else ""
+        language = self.language
+
+        def save() -> Tuple[Optional[Path], Optional[str]]:
             backup_path: Optional[Path] = None
-            if self.backup_checkbox.isChecked() and qb_text:
-                source_path = Path(qb_text)
+            if backup_source:
+                source_path = Path(backup_source)
                 if source_path.exists():
                     backup_path = source_path.with_name(source_path.stem + "_Backup" + source_path.suffix)
-                    shutil.copy2(source_path, backup_path)
-
-            self._write_table(self.updated_df, path, self.language)
-            info = [self.tr("saved_file", path=path)]
+                    _fast_copy(source_path, backup_path)
 
-            if backup_path is not None and backup_path.exists():
-                info.append(self.tr("saved_backup", path=backup_path))
+            if stream_writer is not None:
+                stream_writer(path)
+            else:
+                self._write_table(updated_df, path, language)
 
-            if self.unmatched_checkbox.isChecked() and self.unmatched_df is not None and not self.unmatched_df.empty:
+            unmatched_path: Optional[str] = None
+            if unmatched_df is not None and not unmatched_df.empty:
                 unmatched_ext = Path(path).suffix if Path(path).suffix.lower() in {".csv", ".xlsx"} else ".csv"
                 unmatched_path = str(Path(path).with_name(Path(path).stem + "_Unmatched" + unmatched_ext))
-                self._write_table(self.unmatched_df, unmatched_path, self.language)
-                info.append(self.tr("saved_unmatched", path=unmatched_path))
+                self._write_table(unmatched_df, unmatched_path, language)
+            return backup_path, unmatched_path
+
+        self._set_status(self.tr("processing"))
+        self._run_in_background(
+            save,
+            lambda paths: self._on_saved(path, *paths),
+            lambda message: self._error(self.tr("save_err", error=message)),
+        )
 
-            QMessageBox.information(self, self.tr("saved_title"), "\n".join(info))
-            self._update_summary("\n".join(info))
-            self._set_status(self.tr("files_saved"))
-        except Exception as exc:
-            self._error(self.tr("save_err", error=exc))
+    def _on_saved(self, path: str, backup_path: Optional[Path], unmatched_path: Optional[str]) -> None:
+        info = [self.tr("saved_file", path=path)]
+        if backup_path is not None and backup_path.exists():
+            info.append(self.tr("saved_backup", path=backup_path))
+        if unmatched_path is not None:
+            info.append(self.tr("saved_unmatched", path=unmatched_path))
+
+        QMessageBox.information(self, self.tr("saved_title"), "\n".join(info))
+        self._update_summary("\n".join(info))
+        self._set_status(self.tr("files_saved"))
 
     def show_matching_help(self) -> None:
         QToolTip.showText(self.mapToGlobal(self.rect().center()), self.tr("help_text"), self, self.rect(), 8000)
 
     def _render_preview(self, df: pd.DataFrame) -> None:
-        preview = df.head(100)
-        self.preview_table.setRowCount(len(preview))
-        self.preview_table.setColumnCount(len(preview.columns))
-        self.preview_table.setHorizontalHeaderLabels([str(c) for c in preview.columns])
-
-        for row_idx in range(len(preview)):
-            for col_idx in range(len(preview.columns)):
-                value = "" if pd.isna(preview.iloc[row_idx, col_idx]) else str(preview.iloc[row_idx, col_idx])
-                self.preview_table.setItem(row_idx, col_idx, QTableWidgetItem(value))
-
+        # The view only asks the model for visible cells, so no per-cell items are created.
+        self.preview_rows = max(10, min(PREVIEW_ROWS, PREVIEW_MAX_CELLS // max(1, len(df.columns))))
+        self.preview_title_label.setText(self.tr("preview", rows=self.preview_rows))
+        model = self.preview_table.model()
+        if isinstance(model, DataFrameModel):
+            model.set_frame(df.head(self.preview_rows))
+        else:
+            self._set_preview_model(DataFrameModel(df.head(self.preview_rows), self.preview_table))
         self.preview_table.resizeColumnsToContents()
 
+    def _set_preview_model(self, model: Optional[DataFrameModel]) -> None:
+        previous = self.preview_table.model()
+        self.preview_table.setModel(model)
+        if previous is not None:
+            previous.deleteLater()
+
     def _error(self, message: str) -> None:
         QMessageBox.critical(self, self.tr("error_title"), message)
         self._update_summary(f"{self.tr('error_title')}: {message}")
@@ -796,7 +1450,7 @@ def main() -> None:
         splash.close()
         login = LoginDialog(language="en")
         if login.exec() == QDialog.Accepted:
-            window.language = login.language
+            window._set_language(login.language)
             window.language_combo.setCurrentIndex(0 if window.language == "en" else 1)
             window._apply_texts()
             window.show()
@@ -804,6 +1458,8 @@ def main() -> None:
         app.quit()
 
     splash.show()
+    # Finish loading pandas while the splash is up, on the GUI thread, before any worker needs it.
+    QTimer.singleShot(0, lambda: pd.DataFrame)
     QTimer.singleShot(2000, show_main_window)
 
     sys.exit(app.exec())